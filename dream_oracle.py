@@ -1,11 +1,31 @@
 import os
+import re
+import sys
 import json
+import gzip
+import base64
+import zlib
+import atexit
+import shutil
 import time
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+import random
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit, unquote
+from urllib.request import getproxies, proxy_bypass
+
+try:
+    import orjson # Optional: a much faster JSON library, used if it is installed
+except ImportError:
+    orjson = None
 
 # --- Configuration ---
 JOURNAL_FILE = "dream_journal.txt"
+JOURNAL_SEPARATOR = b"\n" + b"=" * 60 + b"\n\n" # Ends every journal entry
+# Set SAVE_DURABLE=1 to force every saved dream onto the disk (slower, crash-safe)
+SAVE_DURABLE = os.getenv("SAVE_DURABLE", "").lower() in ("1", "true", "yes")
 API_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
 # We hard-code a reliable model instead of searching for one
 # UPDATED: Corrected the model ID to the one that works
@@ -14,6 +34,22 @@ API_TIMEOUT = 45
 MAX_OUTPUT_TOKENS = 2048 
 GENERATION_TEMPERATURE = 0.8
 MAX_RETRIES = 3 # Number of times to retry on network errors
+RETRY_BASE_DELAY = 0.5 # Seconds; the backoff window doubles on each attempt
+RETRY_MAX_DELAY = 30.0 # Seconds; upper bound for the backoff window
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504) # Rate limits and server hiccups
+REQUESTS_PER_MINUTE = 15 # Gemini free-tier quota; we pace ourselves to stay under it
+BATCH_CONCURRENCY = 8 # How many dreams from a batch file are sent to the API at once
+TYPING_MODE = "char" # "char" types one letter at a time, "word" types a whole word at a time
+
+# --- JSON Encoding ---
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
 
 # --- ANSI Color Codes for Terminal Styling ---
 class Colors:
@@ -27,158 +63,485 @@ class Colors:
     BOLD = '\033[1m'
 
 
-def typing_effect(text, delay=0.03, color=Colors.CYAN):
+# --- Pre-styled Messages ---
+# These never change, so the color codes are joined onto them once, here.
+_MENU_BANNER = (
+    f"\n{Colors.CYAN}{Colors.BOLD}--- Dream Oracle Menu ---{Colors.ENDC}\n"
+    f"{Colors.GREEN}1. Interpret a New Dream\n"
+    f"{Colors.BLUE}2. View Your Dream Journal\n"
+    f"{Colors.RED}3. Clear Your Dream Journal\n"
+    f"{Colors.YELLOW}4. Exit\n"
+    f"{Colors.MAGENTA}5. Interpret a Batch of Dreams from a File{Colors.ENDC}"
+)
+_PROMPT_CHOICE = f"\n{Colors.BOLD}Choose an option (1-5): {Colors.ENDC}"
+_PROMPT_DREAM = f"\n{Colors.CYAN}Describe your dream in detail:\n> {Colors.ENDC}"
+_PROMPT_SAVE = f"\n{Colors.GREEN}Would you like to record this vision in your journal? (y/n): {Colors.ENDC}"
+_PROMPT_SAVE_BATCH = f"\n{Colors.GREEN}Would you like to record these visions in your journal? (y/n): {Colors.ENDC}"
+_PROMPT_BATCH_FILE = f"\n{Colors.CYAN}Path to a file with one dream per line:\n> {Colors.ENDC}"
+_PROMPT_CLEAR = (
+    f"{Colors.YELLOW}Are you sure you want to erase all saved dreams? "
+    f"This cannot be undone. (y/n): {Colors.ENDC}"
+)
+_ORACLE_GAZING = f"\n{Colors.MAGENTA}The Oracle is gazing into the ether... please wait.{Colors.ENDC}"
+_ORACLE_HEADER = f"\n{Colors.BOLD}{Colors.MAGENTA}--- The Oracle Speaks ---{Colors.ENDC}"
+_JOURNAL_HEADER = f"\n{Colors.BOLD}{Colors.MAGENTA}📜 Your Dream Journal 📜{Colors.ENDC}"
+_JOURNAL_RULE = f"{Colors.BLUE}{'-'*60}{Colors.ENDC}"
+_JOURNAL_TEXT_START = Colors.CYAN.encode()
+_JOURNAL_TEXT_END = (Colors.ENDC + "\n").encode()
+_ERROR_EMPTY_DREAM = f"{Colors.YELLOW}You must provide a dream to be interpreted.{Colors.ENDC}"
+_ERROR_INVALID_CHOICE = f"{Colors.RED}Invalid choice. Please select a number from 1 to 5.{Colors.ENDC}"
+_ERROR_API_FAILED = f"{Colors.RED}API call failed after all retries.{Colors.ENDC}"
+
+
+# --- Persistent HTTP Connection ---
+# Opening a new connection means a fresh TCP + TLS handshake for every dream
+# (and every retry), so we keep one connection open and reuse it.
+# Each thread gets its own connection, since one connection can't carry two requests at once.
+_API_ENDPOINT = urlsplit(API_BASE_URL)
+# The one endpoint we call: streamed generation, sent back as server-sent events
+_GENERATE_URL = f"{API_BASE_URL}/models/{MODEL_ID}:streamGenerateContent?alt=sse"
+_GENERATE_PATH = _GENERATE_URL[len(f"{_API_ENDPOINT.scheme}://{_API_ENDPOINT.netloc}"):]
+_thread_state = threading.local()
+
+
+def _open_connection(timeout):
+    """
+    Creates a connection to the API host. If an HTTPS proxy is configured
+    (HTTPS_PROXY / https_proxy), it connects to the proxy and tunnels through it.
+    """
+    if _API_ENDPOINT.scheme == "http":
+        return http.client.HTTPConnection(_API_ENDPOINT.netloc, timeout=timeout)
+    
+    proxy = getproxies().get("https")
+    if not proxy or proxy_bypass(_API_ENDPOINT.hostname):
+        return http.client.HTTPSConnection(_API_ENDPOINT.netloc, timeout=timeout)
+    
+    proxy_url = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    tunnel_headers = {}
+    if proxy_url.username:
+        credentials = f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+        tunnel_headers['Proxy-Authorization'] = "Basic " + base64.b64encode(credentials.encode()).decode()
+    connection = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port or 80, timeout=timeout)
+    connection.set_tunnel(_API_ENDPOINT.hostname, _API_ENDPOINT.port or 443, headers=tunnel_headers)
+    return connection
+
+
+def _get_connection(timeout=API_TIMEOUT):
+    """Returns this thread's keep-alive connection, opening it if needed."""
+    connection = getattr(_thread_state, "connection", None)
+    if connection is None:
+        connection = _open_connection(timeout)
+        _thread_state.connection = connection
+    return connection
+
+
+def _reset_connection():
+    """Drops this thread's connection so the next request opens a fresh one."""
+    connection = getattr(_thread_state, "connection", None)
+    if connection is not None:
+        connection.close()
+        _thread_state.connection = None
+
+
+def _send_request(method, path, body, headers):
+    """
+    Sends a request over this thread's connection and returns the response.
+    Servers close keep-alive connections that sit idle (e.g. while the user
+    types their next dream), so if a reused connection turns out to be closed
+    before any reply arrives, we quietly reconnect and send it once more.
+    """
+    conn = _get_connection()
+    reused = conn.sock is not None
+    try:
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse()
+    except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+        if not reused:
+            raise
+    _reset_connection()
+    conn = _get_connection()
+    conn.request(method, path, body=body, headers=headers)
+    return conn.getresponse()
+
+
+class TokenBucket:
+    """
+    A simple token-bucket rate limiter.
+    Each request takes one token; tokens refill at a steady rate. If the bucket
+    is empty we wait for the next token instead of letting the API reject us.
+    """
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = capacity
+        self.refill_rate = refill_rate # Tokens per second
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def acquire(self):
+        """Blocks until a token is available, then takes it."""
+        with self.lock:
+            self._refill()
+            wait = max(0, (1 - self.tokens) / self.refill_rate)
+            if wait:
+                time.sleep(wait)
+                self._refill()
+            self.tokens -= 1
+
+
+_LIMITER = TokenBucket(capacity=REQUESTS_PER_MINUTE, refill_rate=REQUESTS_PER_MINUTE / 60)
+
+
+# --- Journal File Handle ---
+# The journal is opened once and kept open, instead of reopening it for every save.
+_journal_file = None
+
+
+def _get_journal():
+    """Returns the open journal file (binary, UTF-8 content), opening it for appending if needed."""
+    global _journal_file
+    if _journal_file is None:
+        _journal_file = open(JOURNAL_FILE, "ab", buffering=64 * 1024)
+    return _journal_file
+
+
+def _close_journal():
+    """Flushes and closes the journal file if it is open."""
+    global _journal_file
+    if _journal_file is not None:
+        _journal_file.close()
+        _journal_file = None
+
+
+atexit.register(_close_journal)
+
+
+def typing_effect(text, delay=0.03, color=Colors.CYAN, end='\n'):
     """Prints text with a typing effect."""
     text_to_print = str(text)
-    for char in text_to_print:
-        print(color + char, end='', flush=True)
-        time.sleep(delay)
-    print(Colors.ENDC)
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    
+    # Set the color once, then write the text piece by piece
+    write(color)
+    if TYPING_MODE == "word":
+        # One write per word (plus its trailing space), pausing as long as typing it would take
+        for word in re.findall(r'\S+\s*|\s+', text_to_print):
+            write(word)
+            flush()
+            time.sleep(delay * len(word))
+    else:
+        for char in text_to_print:
+            write(char)
+            flush()
+            time.sleep(delay)
+    write(Colors.ENDC + end)
+    flush()
+
+
+def _is_gzipped(response):
+    return response.getheader('Content-Encoding', '').lower() == 'gzip'
+
 
+def _read_body(response):
+    """Reads a whole response body, un-gzipping it if the server compressed it."""
+    body = response.read()
+    return gzip.decompress(body) if _is_gzipped(response) else body
 
-def make_api_request(url, api_key, method='POST', data=None, timeout=API_TIMEOUT):
+
+def _iter_lines(response):
+    """Yields the lines of a response body as they arrive, un-gzipping on the fly if needed."""
+    if not _is_gzipped(response):
+        yield from response
+        return
+    
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) # 16+ means "expect a gzip header"
+    pending = b""
+    while True:
+        block = response.read1(64 * 1024)
+        if not block:
+            break
+        pending += decompressor.decompress(block)
+        # Hand out every complete line; keep the unfinished tail for the next block
+        *lines, pending = pending.split(b"\n")
+        yield from lines
+    pending += decompressor.flush()
+    yield from pending.split(b"\n")
+
+
+def _iter_sse_events(response):
+    """Yields each JSON event from a server-sent events response as it arrives."""
+    finished = False
+    try:
+        for line in _iter_lines(response):
+            if line.startswith(b"data: "):
+                yield _json_loads(line[6:])
+        response.read() # Marks the response done so the connection can be reused
+        finished = True
+    finally:
+        if not finished:
+            # A half-read response leaves the connection unusable, so start over next time
+            _reset_connection()
+
+
+def backoff_delay(attempt, retry_after=None):
     """
-    Makes an API request with proper header-based authentication and retry logic.
+    Returns how long to sleep before the next retry.
+    Uses "full jitter": a random wait inside an exponentially growing window,
+    so clients that failed together don't all retry at the same moment.
+    """
+    delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+    if retry_after:
+        try:
+            # The server told us how long to wait, so never retry sooner than that
+            # (but never leave the user waiting longer than our own cap)
+            delay = max(delay, min(float(retry_after), RETRY_MAX_DELAY))
+        except ValueError:
+            pass # Retry-After can also be an HTTP date; just use our own delay
+    return delay
+
+
+def _post_generate(payload, api_key):
+    """
+    Sends an encoded request body to the generate endpoint, with proper
+    header-based authentication and retry logic, and returns an iterator over
+    the server-sent events. Only connecting is retried, not a broken stream.
     This is the most complex part, added to handle bad network connections.
     """
     headers = {
         'Content-Type': 'application/json',
+        'Accept-Encoding': 'gzip', # Roughly halves the bytes sent back for JSON replies
         'x-goog-api-key': api_key
     }
     
-    request_data = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=request_data, headers=headers, method=method)
-    
     last_exception = None
     # Try the request up to MAX_RETRIES times
     for attempt in range(MAX_RETRIES):
+        will_retry = attempt < MAX_RETRIES - 1 # No point waiting after the last attempt
+        retry_note = " Retrying..." if will_retry else ""
         try:
-            # Try to open the URL
-            with urlopen(req, timeout=timeout) as response:
-                body = response.read().decode('utf-8')
-                return json.loads(body) # Success!
+            # Send the request over the shared connection
+            response = _send_request('POST', _GENERATE_PATH, payload, headers)
+            # A successful stream is read as it arrives; errors are read in full
+            if response.status < 400:
+                return _iter_sse_events(response)
+            body = _read_body(response)
         
-        except HTTPError as e:
-            # An "HTTP Error" (like 404, 500) means the server replied with an error.
-            # We don't retry these, because the error is likely permanent (e.g., bad API key).
-            error_body = e.read().decode('utf-8')
-            print(f"{Colors.RED}API HTTPError: {error_body}{Colors.ENDC}")
-            last_exception = RuntimeError(f"API Error: {e.reason}")
-            break # Stop retrying
-        
-        except URLError as e:
-            # A "URL Error" (like a timeout) means we couldn't reach the server.
-            # This is a network problem, so we SHOULD retry.
-            print(f"{Colors.YELLOW}Network Error (Attempt {attempt + 1}): {e.reason}. Retrying...{Colors.ENDC}")
-            last_exception = RuntimeError(f"Network Error: {e.reason}")
-            time.sleep(2 * (attempt + 1)) # Wait 2s, then 4s, then 6s
+        except (http.client.HTTPException, OSError) as e:
+            # A network error (like a timeout or a dropped connection) means we
+            # couldn't reach the server. This is a network problem, so we SHOULD retry.
+            _reset_connection()
+            print(f"{Colors.YELLOW}Network Error (Attempt {attempt + 1}): {e}.{retry_note}{Colors.ENDC}")
+            last_exception = RuntimeError(f"Network Error: {e}")
+            if will_retry:
+                time.sleep(backoff_delay(attempt))
+            continue
         
         except Exception as e:
             # Any other unexpected error
-            print(f"{Colors.RED}Unexpected Error (Attempt {attempt + 1}): {e}. Retrying...{Colors.ENDC}")
+            _reset_connection()
+            print(f"{Colors.RED}Unexpected Error (Attempt {attempt + 1}): {e}.{retry_note}{Colors.ENDC}")
             last_exception = RuntimeError(f"Unexpected error: {e}")
-            time.sleep(2 * (attempt + 1))
+            if will_retry:
+                time.sleep(backoff_delay(attempt))
+            continue
+        
+        if response.status in RETRYABLE_STATUS_CODES:
+            # Rate limits (429) and server errors (5xx) are temporary, so we SHOULD retry.
+            print(f"{Colors.YELLOW}API busy (HTTP {response.status}, Attempt {attempt + 1}).{retry_note}{Colors.ENDC}")
+            last_exception = RuntimeError(f"API Error: {response.reason}")
+            if will_retry:
+                time.sleep(backoff_delay(attempt, response.getheader('Retry-After')))
+            continue
+        
+        # Any other "HTTP Error" (like 400, 403, 404) means the server rejected the request.
+        # We don't retry these, because the error is likely permanent (e.g., bad API key).
+        print(f"{Colors.RED}API HTTPError: {body.decode('utf-8', 'replace')}{Colors.ENDC}")
+        last_exception = RuntimeError(f"API Error: {response.reason}")
+        break # Stop retrying
 
     # If all retries failed, raise the last error
     raise last_exception
 
 
+# UPDATED: New system prompt based on user request
+# The system prompt never changes, so it is built once here instead of on every call
+_SYSTEM_PROMPT = (
+    "You are the Dream Oracle. Your persona is a blend of the Attack Titan and Sir Nighteye. "
+    "You see the core truth of the dream, a future path, and you will state it plainly. "
+    "You are not here to comfort. You are here to reveal the **facts** you have seen.\n\n"
+    "1.  **Your Viewpoint:** Be cutthroat, honest, and factual. Find the central truth. Do not sugar-coat it.\n"
+    "2.  **Your Presentation:** Be artistic, poetic, and melodramatic. Present the hard truth in a grand, impactful style. Use clear, powerful words, not overly complex ones.\n"
+    "3.  **Your Knowledge:** Ground your interpretation in real-world symbology. Casually reference what a symbol (like 'water' or 'falling') means in psychology or across different cultures/religions to prove your point.\n\n"
+    "Start by declaring the core truth you've seen. End with a sharp, profound statement that forces the user to confront this reality."
+)
+
+# The request body is also fixed except for the prompt text, so we encode it to JSON
+# once and only drop the (JSON-escaped) prompt into the "%s" slot for each dream.
+_PAYLOAD_TEMPLATE = json.dumps({
+    "contents": [
+        {
+            "role": "user",
+            "parts": [{"text": "__PROMPT__"}]
+        }
+    ],
+    "generationConfig": {
+        "temperature": GENERATION_TEMPERATURE,
+        "maxOutputTokens": MAX_OUTPUT_TOKENS
+    }
+}).replace('"__PROMPT__"', '%s').encode('utf-8')
+
+
+@lru_cache(maxsize=32) # Re-submitting the same dream reuses the prompt we already built
 def build_prompt(dream_description):
     """Builds the complete prompt for the AI."""
-    # UPDATED: New system prompt based on user request
-    system_prompt = (
-        "You are the Dream Oracle. Your persona is a blend of the Attack Titan and Sir Nighteye. "
-        "You see the core truth of the dream, a future path, and you will state it plainly. "
-        "You are not here to comfort. You are here to reveal the **facts** you have seen.\n\n"
-        "1.  **Your Viewpoint:** Be cutthroat, honest, and factual. Find the central truth. Do not sugar-coat it.\n"
-        "2.  **Your Presentation:** Be artistic, poetic, and melodramatic. Present the hard truth in a grand, impactful style. Use clear, powerful words, not overly complex ones.\n"
-        "3.  **Your Knowledge:** Ground your interpretation in real-world symbology. Casually reference what a symbol (like 'water' or 'falling') means in psychology or across different cultures/religions to prove your point.\n\n"
-        "Start by declaring the core truth you've seen. End with a sharp, profound statement that forces the user to confront this reality."
-    )
-    return f"{system_prompt}\n\nHere is the dream you must analyze:\n{dream_description}"
-
-
-def parse_generation_response(response):
+    return f"{_SYSTEM_PROMPT}\n\nHere is the dream you must analyze:\n{dream_description}"
+
+
+def build_payload(dream_description):
+    """Builds the encoded JSON request body for a dream."""
+    return _PAYLOAD_TEMPLATE % _json_dumps(build_prompt(dream_description))
+
+
+def parse_stream_chunk(chunk):
     """
-    Safely parses the API response to extract generated text.
+    Safely parses one streamed API event and returns its new piece of text.
     """
     try:
-        candidate = response.get("candidates", [])[0]
+        candidate = chunk["candidates"][0]
+        
+        # The text that arrived in this chunk (the final chunk may have none)
+        content = candidate.get("content")
+        # (a part may also carry only metadata, such as a thoughtSignature, and no text)
+        text = content["parts"][0].get("text", "") if content and "parts" in content else ""
         
         # Check if the AI was cut off for any reason
         finish_reason = candidate.get("finishReason")
         if finish_reason and finish_reason != "STOP":
             print(f"{Colors.YELLOW}Warning: Response stopped due to {finish_reason}{Colors.ENDC}")
             if finish_reason == "MAX_TOKENS":
-                return "The Oracle's vision was too vast and was cut short. (MAX_TOKENS)."
+                text += "\n\nThe Oracle's vision was too vast and was cut short. (MAX_TOKENS)."
             else:
-                return f"The Oracle's vision was blocked by: {finish_reason}."
-
-        # If everything is fine, get the text
-        text = candidate.get("content", {}).get("parts", [])[0].get("text")
-        if text:
-            return text
-        else:
-            return "The Oracle spoke, but the vision was unclear (could not parse text)."
+                text += f"\n\nThe Oracle's vision was blocked by: {finish_reason}."
+        return text
         
-    except Exception as e:
+    except (KeyError, IndexError, TypeError) as e:
         print(f"{Colors.RED}Error parsing response: {e}{Colors.ENDC}")
-        print(f"Raw Response: {response}")
-        return "A critical error occurred while parsing the Oracle's response."
+        print(f"Raw Response: {chunk}")
+        return ""
+
+
+def stream_interpretation(dream_description, api_key):
+    """
+    Calls the Gemini API for a dream and yields each piece of the
+    interpretation as it arrives. Errors are raised to the caller.
+    """
+    # Wait our turn so we stay under the API's rate limit
+    _LIMITER.acquire()
+    
+    # Create the payload to send to the AI (already encoded as JSON)
+    payload = build_payload(dream_description)
+    
+    for chunk in _post_generate(payload, api_key):
+        text = parse_stream_chunk(chunk)
+        if text:
+            yield text
 
 
 def get_ai_interpretation(dream_description, api_key):
     """
     Gets AI interpretation of a dream by calling the Gemini API.
+    The reply is streamed: each piece is typed out as soon as it arrives,
+    and the full text is returned so it can be saved to the journal.
     """
-    # Build the full API URL
-    url = f"{API_BASE_URL}/models/{MODEL_ID}:generateContent"
+    # Make the API call, typing out each piece of the vision as it arrives
+    pieces = []
+    try:
+        for text in stream_interpretation(dream_description, api_key):
+            typing_effect(text, 0.005, Colors.CYAN, end='')
+            pieces.append(text)
+    except Exception as e:
+        if pieces:
+            message = f"\n\nThe Oracle's vision was interrupted. {e}"
+        else:
+            print(_ERROR_API_FAILED)
+            message = f"The Oracle is silent. {e}"
+        typing_effect(message, 0.02, Colors.CYAN, end='')
+        pieces.append(message)
     
-    # Create the payload to send to the AI
-    payload = {
-        "contents": [
-            {
-                "role": "user",
-                "parts": [{"text": build_prompt(dream_description)}]
-            }
-        ],
-        "generationConfig": {
-            "temperature": GENERATION_TEMPERATURE,
-            "maxOutputTokens": MAX_OUTPUT_TOKENS
-        }
-    }
+    if not pieces:
+        message = "The Oracle spoke, but the vision was unclear (could not parse text)."
+        typing_effect(message, 0.02, Colors.CYAN, end='')
+        pieces.append(message)
+    
+    print()
+    return "".join(pieces)
+
 
-    # Make the API call
+def _interpret_quietly(dream_description, api_key):
+    """Gets the full interpretation of one dream without printing it."""
     try:
-        response = make_api_request(url, api_key, method='POST', data=payload)
-        return parse_generation_response(response)
+        interpretation = "".join(stream_interpretation(dream_description, api_key))
     except Exception as e:
-        print(f"{Colors.RED}API call failed after all retries.{Colors.ENDC}")
         return f"The Oracle is silent. {e}"
+    return interpretation or "The Oracle spoke, but the vision was unclear (could not parse text)."
+
+
+def interpret_many(dreams, api_key):
+    """
+    Interprets several dreams at once and returns their interpretations in order.
+    Up to BATCH_CONCURRENCY requests run in parallel; the rate limiter still
+    paces them so the batch stays under the API quota.
+    """
+    with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY) as pool:
+        return list(pool.map(lambda dream: _interpret_quietly(dream, api_key), dreams))
+
+
+# Control characters to strip from saved text (everything below space except tab,
+# newline and carriage return, plus DEL), as a table so it is one pass over the text
+_CONTROL_CHARS = str.maketrans('', '', ''.join(chr(c) for c in range(32) if c not in (9, 10, 13)) + '\x7f')
 
 
 def sanitize_text(text):
     """Sanitizes text for safe file writing."""
-    return text.replace('\x00', '').strip()
+    return text.translate(_CONTROL_CHARS).strip()
 
 
-def save_dream(dream, interpretation):
-    """Saves the dream and its interpretation to the journal file."""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+def _write_entry(dream, interpretation):
+    """Appends one journal entry to the write buffer (without flushing it)."""
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S").encode()
     
     dream = sanitize_text(dream)
     interpretation = sanitize_text(interpretation)
     
-    entry = (
-        f"Time: {timestamp}\n"
-        f"Dream: {dream}\n\n"
-        f"Interpretation:\n{interpretation}\n"
-        f"{'=' * 60}\n\n"
-    )
-    
+    # Build the entry straight from encoded pieces, so it is only copied once
+    entry = b"".join((
+        b"Time: ", timestamp,
+        b"\nDream: ", dream.encode('utf-8', 'replace'),
+        b"\n\nInterpretation:\n", interpretation.encode('utf-8', 'replace'),
+        JOURNAL_SEPARATOR,
+    ))
+    _get_journal().write(entry)
+
+
+def _commit_journal():
+    """Pushes buffered entries out to the journal file (and onto disk if SAVE_DURABLE)."""
+    f = _get_journal()
+    f.flush()
+    if SAVE_DURABLE:
+        os.fsync(f.fileno())
+
+
+def save_dream(dream, interpretation):
+    """Saves the dream and its interpretation to the journal file."""
     try:
-        with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
-            f.write(entry)
+        _write_entry(dream, interpretation)
+        _commit_journal()
         typing_effect("Your dream has been etched into memory.", 0.02, Colors.GREEN)
     except Exception as e:
         print(f"{Colors.RED}Failed to save dream: {e}{Colors.ENDC}")
@@ -186,17 +549,29 @@ def save_dream(dream, interpretation):
 
 def view_journal():
     """Displays the contents of the dream journal."""
-    if not os.path.exists(JOURNAL_FILE):
+    # One stat call tells us both whether the journal exists and whether it has anything in it
+    try:
+        is_empty = os.stat(JOURNAL_FILE).st_size == 0
+    except FileNotFoundError:
+        is_empty = True
+    
+    if is_empty:
         typing_effect("Your dream journal is empty. Time to start dreaming!", 
                       0.02, Colors.YELLOW)
         return
     
     try:
-        with open(JOURNAL_FILE, "r", encoding="utf-8") as f:
-            print(f"\n{Colors.BOLD}{Colors.MAGENTA}📜 Your Dream Journal 📜{Colors.ENDC}")
-            print(f"{Colors.BLUE}{'-'*60}{Colors.ENDC}")
-            print(Colors.CYAN + f.read() + Colors.ENDC)
-            print(f"{Colors.BLUE}{'-'*60}{Colors.ENDC}")
+        with open(JOURNAL_FILE, "rb") as f:
+            print(_JOURNAL_HEADER)
+            print(_JOURNAL_RULE, flush=True)
+            # Copy the file straight to the terminal in chunks, instead of
+            # loading the whole journal into memory first
+            out = sys.stdout.buffer
+            out.write(_JOURNAL_TEXT_START)
+            shutil.copyfileobj(f, out, 64 * 1024)
+            out.write(_JOURNAL_TEXT_END)
+            out.flush()
+            print(_JOURNAL_RULE)
     except Exception as e:
         print(f"{Colors.RED}Could not read the journal file: {e}{Colors.ENDC}")
 
@@ -207,13 +582,11 @@ def clear_journal():
         typing_effect("No journal found to clear.", 0.02, Colors.YELLOW)
         return
     
-    confirm = input(
-        f"{Colors.YELLOW}Are you sure you want to erase all saved dreams? "
-        f"This cannot be undone. (y/n): {Colors.ENDC}"
-    ).lower()
+    confirm = input(_PROMPT_CLEAR).lower()
     
     if confirm == 'y':
         try:
+            _close_journal() # Let go of the file before deleting it
             os.remove(JOURNAL_FILE)
             typing_effect("The old memories have faded into mist. Your journal is clear.", 
                           0.02, Colors.RED)
@@ -223,14 +596,43 @@ def clear_journal():
         typing_effect("The journal remains untouched.", 0.02, Colors.GREEN)
 
 
+def interpret_batch(api_key):
+    """Interprets every dream in a file (one per line) and offers to save them."""
+    path = input(_PROMPT_BATCH_FILE).strip()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            dreams = [line.strip() for line in f if line.strip()]
+    except Exception as e:
+        print(f"{Colors.RED}Could not read the dream file: {e}{Colors.ENDC}")
+        return
+    
+    if not dreams:
+        typing_effect("That file holds no dreams to interpret.", 0.02, Colors.YELLOW)
+        return
+    
+    print(_ORACLE_GAZING)
+    interpretations = interpret_many(dreams, api_key)
+    
+    for number, (dream, interpretation) in enumerate(zip(dreams, interpretations), 1):
+        print(f"\n{Colors.BOLD}{Colors.MAGENTA}--- Vision {number} of {len(dreams)} ---{Colors.ENDC}")
+        print(f"{Colors.BLUE}Dream: {dream}{Colors.ENDC}\n")
+        print(Colors.CYAN + interpretation + Colors.ENDC)
+    
+    if input(_PROMPT_SAVE_BATCH).lower() == 'y':
+        # Write every entry into the buffer, then flush once for the whole batch
+        try:
+            for dream, interpretation in zip(dreams, interpretations):
+                _write_entry(dream, interpretation)
+            _commit_journal()
+            typing_effect("Your dreams have been etched into memory.", 0.02, Colors.GREEN)
+        except Exception as e:
+            print(f"{Colors.RED}Failed to save dreams: {e}{Colors.ENDC}")
+
+
 def main_menu():
     """Displays the main menu and returns user's choice."""
-    print(f"\n{Colors.CYAN}{Colors.BOLD}--- Dream Oracle Menu ---{Colors.ENDC}")
-    print(f"{Colors.GREEN}1. Interpret a New Dream")
-    print(f"{Colors.BLUE}2. View Your Dream Journal")
-    print(f"{Colors.RED}3. Clear Your Dream Journal")
-    print(f"{Colors.YELLOW}4. Exit{Colors.ENDC}")
-    return input(f"\n{Colors.BOLD}Choose an option (1-4): {Colors.ENDC}").strip()
+    print(_MENU_BANNER)
+    return input(_PROMPT_CHOICE).strip()
 
 
 def get_api_key():
@@ -274,21 +676,17 @@ def main():
         choice = main_menu()
         
         if choice == '1':
-            dream = input(f"\n{Colors.CYAN}Describe your dream in detail:\n> {Colors.ENDC}")
+            dream = input(_PROMPT_DREAM)
             
             if not dream.strip():
-                print(f"{Colors.YELLOW}You must provide a dream to be interpreted.{Colors.ENDC}")
+                print(_ERROR_EMPTY_DREAM)
                 continue
             
-            print(f"\n{Colors.MAGENTA}The Oracle is gazing into the ether... please wait.{Colors.ENDC}")
+            print(_ORACLE_GAZING)
+            print(_ORACLE_HEADER)
             interpretation = get_ai_interpretation(dream, api_key)
             
-            print(f"\n{Colors.BOLD}{Colors.MAGENTA}--- The Oracle Speaks ---{Colors.ENDC}")
-            typing_effect(interpretation, 0.02, Colors.CYAN)
-            
-            save_choice = input(
-                f"\n{Colors.GREEN}Would you like to record this vision in your journal? (y/n): {Colors.ENDC}"
-            ).lower()
+            save_choice = input(_PROMPT_SAVE).lower()
             
             if save_choice == 'y':
                 save_dream(dream, interpretation)
@@ -304,13 +702,11 @@ def main():
                           0.03, Colors.MAGENTA)
             break
         
-        else:
-            print(f"{Colors.RED}Invalid choice. Please select a number from 1 to 4.{Colors.ENDC}")
+        elif choice == '5':
+            interpret_batch(api_key)
         
-        try:
-            input(f"\n{Colors.YELLOW}Press Enter to return to the menu...{Colors.ENDC}")
-        except EOFError:
-            pass
+        else:
+            print(_ERROR_INVALID_CHOICE)
 
 
 if __name__ == "__main__":